@@ -0,0 +1,82 @@
+"""Headless tests for the parse flow in ParseTesterApp."""
+
+import asyncio
+import threading
+
+from textual.widgets import Static, TextArea
+
+import tptpy.__main__ as tp
+
+TEMPLATE = """Value INTF (\\S+)
+
+Start
+  ^${INTF} -> Record
+"""
+
+
+async def _parse_and_wait(app, pilot, expect: str) -> str:
+    app.action_parse()
+    status = ""
+    for _ in range(40):
+        await pilot.pause(0.05)
+        status = str(app.query_one("#status-bar", Static).render())
+        if expect in status:
+            break
+    return status
+
+
+def test_inputs_are_hashed_off_the_ui_thread(monkeypatch):
+    threads = []
+    digest = tp._digest
+
+    def recording_digest(text: str) -> bytes:
+        threads.append(threading.current_thread())
+        return digest(text)
+
+    monkeypatch.setattr(tp, "_digest", recording_digest)
+
+    async def run() -> tuple[str, str]:
+        app = tp.ParseTesterApp(".")
+        async with app.run_test() as pilot:
+            app.query_one("#source-text", TextArea).load_text("Gi0/1\n")
+            app.query_one("#template-text", TextArea).load_text(TEMPLATE)
+            first = await _parse_and_wait(app, pilot, "Parsed")
+            second = await _parse_and_wait(app, pilot, "Unchanged")
+            return first, second
+
+    first, second = asyncio.run(run())
+    assert "Parsed 1 record with TEXTFSM" in first
+    assert "Unchanged since last TEXTFSM parse" in second
+    assert threads
+    assert threading.main_thread() not in threads
+
+
+def test_stale_results_are_not_painted():
+    async def run() -> tuple[str, str]:
+        app = tp.ParseTesterApp(".")
+        async with app.run_test() as pilot:
+            app.query_one("#source-text", TextArea).load_text("Gi0/1\n")
+            app.query_one("#template-text", TextArea).load_text(TEMPLATE)
+            await _parse_and_wait(app, pilot, "Parsed")
+            shown = app.query_one("#result-json", TextArea).text
+            # A run for other inputs that got past its cancellation checks
+            # before the user re-parsed the inputs on screen.
+            stale_seq = app._parse_seq
+            status = await _parse_and_wait(app, pilot, "Unchanged")
+            app._apply_results(
+                seq=stale_seq,
+                parser_name="textfsm",
+                source="Gi0/2\n",
+                template=TEMPLATE,
+                results=[{"INTF": "Gi0/2"}],
+                json_str='[{"INTF": "Gi0/2"}]',
+                snippet=None,
+                run_key=("textfsm", b"stale", b"stale"),
+            )
+            await pilot.pause(0.05)
+            assert app.query_one("#result-json", TextArea).text == shown
+            return shown, status
+
+    shown, status = asyncio.run(run())
+    assert "Gi0/1" in shown
+    assert "Unchanged since last TEXTFSM parse" in status
@@ -0,0 +1,21 @@
+"""Tests for the friendly parse-error messages."""
+
+import pytest
+
+from tptpy.__main__ import format_parse_error, parse_textfsm
+
+
+def _textfsm_error(template: str) -> str:
+    with pytest.raises(Exception) as info:
+        parse_textfsm("x\n", template)
+    return format_parse_error("textfsm", info.value, template)
+
+
+def test_missing_start_state_hint():
+    message = _textfsm_error("Value X (\\d+)\n\nFoo\n  ^${X} -> Record\n")
+    assert "Issue: Missing 'Start' state." in message
+
+
+def test_blank_line_between_values_hint():
+    message = _textfsm_error("Value X (\\d+)\n\nValue Y (\\d+)\n\nStart\n")
+    assert "Issue: Invalid state name" in message
@@ -0,0 +1,14 @@
+"""Tests for loading files into the editor panes."""
+
+import tptpy.__main__ as tp
+
+
+def test_large_files_decode_like_small_ones(tmp_path, monkeypatch):
+    path = tmp_path / "capture.txt"
+    path.write_text("héllo\r\nGi0/1 up\rGi0/2 down\n", newline="")
+    size = path.stat().st_size
+    small = tp.read_text_file(path, size)
+    assert small == "héllo\nGi0/1 up\nGi0/2 down\n"
+
+    monkeypatch.setattr(tp, "LARGE_FILE_BYTES", 0)
+    assert tp.read_text_file(path, size) == small
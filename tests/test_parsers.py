@@ -0,0 +1,51 @@
+"""Tests for the cached parser backends."""
+
+from ttp import ttp
+
+from tptpy.__main__ import parse_textfsm, parse_ttp
+
+TTP_RECORD = """<group name="host">
+hostname {{ hostname | record("hn") }}
+</group>
+<group name="ips">
+ip {{ ip | count(globvar="n") }}
+{{ hn | set("hn") }}
+</group>"""
+
+TEXTFSM_INTF = """Value INTF (\\S+)
+Value STATUS (up|down)
+
+Start
+  ^${INTF}\\s+${STATUS} -> Record
+"""
+
+
+def _fresh_ttp(source: str, template: str) -> list:
+    parser = ttp(data=source, template=template)
+    parser.parse()
+    return parser.result(format="raw")[0]
+
+
+def test_ttp_runs_do_not_share_state():
+    sources = [
+        "hostname R1\nip 1.1.1.1\n",
+        "ip 2.2.2.2\n",
+        "hostname R3\nip 3.3.3.3\n",
+        "ip 2.2.2.2\n",
+    ]
+    for source in sources:
+        assert parse_ttp(source, TTP_RECORD) == _fresh_ttp(source, TTP_RECORD)
+    assert parse_ttp("ip 2.2.2.2\n", TTP_RECORD) == [
+        {"ips": {"ip": "2.2.2.2", "hn": "hn"}}
+    ]
+
+
+def test_textfsm_runs_do_not_share_state():
+    first = parse_textfsm("Gi0/1 up\nGi0/2 down\n", TEXTFSM_INTF)
+    assert first == [
+        {"INTF": "Gi0/1", "STATUS": "up"},
+        {"INTF": "Gi0/2", "STATUS": "down"},
+    ]
+    assert parse_textfsm("Gi0/3 up\n", TEXTFSM_INTF) == [
+        {"INTF": "Gi0/3", "STATUS": "up"}
+    ]
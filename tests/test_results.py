@@ -0,0 +1,47 @@
+"""Tests for turning parse results into table rows."""
+
+import asyncio
+
+from textual.widgets import DataTable, Select, Static, TextArea
+
+from tptpy.__main__ import ParseTesterApp, _table_rows
+
+
+def test_table_rows_without_columns():
+    # TTP returns [{}] when the template matches nothing.
+    assert _table_rows([{}], []) == [[]]
+
+
+def test_table_rows_uniform_and_ragged():
+    records = [{"a": "1", "b": 2}, {"a": "3", "b": 4.5}]
+    assert _table_rows(records, ["a", "b"]) == [["1", "2"], ["3", "4.5"]]
+    assert _table_rows([{"a": "1"}, {}], ["a"]) == [["1"], [""]]
+    assert _table_rows([{"a": "1", "b": "2"}, {"a": "3"}], ["a", "b"]) == [
+        ["1", "2"],
+        ["3", ""],
+    ]
+
+
+def test_ttp_no_match_does_not_crash_app():
+    async def run() -> str:
+        app = ParseTesterApp(".")
+        async with app.run_test() as pilot:
+            app.query_one("#parser-select", Select).value = "ttp"
+            app.query_one("#source-text", TextArea).load_text(
+                "nothing matches"
+            )
+            app.query_one("#template-text", TextArea).load_text(
+                "interface {{ intf }}"
+            )
+            await pilot.pause(0.05)
+            app.action_parse()
+            status = ""
+            for _ in range(40):
+                await pilot.pause(0.05)
+                status = str(app.query_one("#status-bar", Static).render())
+                if "Parsed" in status:
+                    break
+            assert app.query_one("#result-table", DataTable).row_count == 1
+            return status
+
+    assert "Parsed 1 record with TTP" in asyncio.run(run())
@@ -0,0 +1,15 @@
+"""Tests for the generated Python snippets."""
+
+import tptpy.__main__ as tp
+
+
+def test_snippet_cache_skips_large_inputs():
+    tp._SNIPPET_CACHE.clear()
+    small = tp.cached_snippet("ttp", "x 1\n", "x {{ n }}")
+    assert small == tp.generate_snippet("ttp", "x 1\n", "x {{ n }}")
+    assert len(tp._SNIPPET_CACHE) == 1
+
+    big_source = "x 1\n" * (tp.SNIPPET_EAGER_BYTES // 4 + 1)
+    big = tp.cached_snippet("ttp", big_source, "x {{ n }}")
+    assert big == tp.generate_snippet("ttp", big_source, "x {{ n }}")
+    assert len(tp._SNIPPET_CACHE) == 1
@@ -0,0 +1,85 @@
+"""Tests for the scandir-backed directory trees."""
+
+import asyncio
+import shutil
+from pathlib import Path
+
+from textual.app import App, ComposeResult
+
+from tptpy.__main__ import FilteredDirectoryTree
+
+
+class TreeApp(App):
+    def __init__(self, tree_root: Path):
+        super().__init__()
+        self.tree_root = tree_root
+
+    def compose(self) -> ComposeResult:
+        yield FilteredDirectoryTree(self.tree_root)
+
+
+async def _wait_for(pilot, condition) -> None:
+    for _ in range(40):
+        if condition():
+            return
+        await pilot.pause(0.05)
+    raise AssertionError("tree did not finish loading")
+
+
+def _make_tree(root: Path) -> None:
+    (root / "sub").mkdir()
+    (root / "sub" / "inner.log").touch()
+    (root / "a.txt").touch()
+    (root / "b.bin").touch()
+
+
+def test_listing_types_come_from_scandir(tmp_path, monkeypatch):
+    # DirectoryTree's _directory_content/_safe_is_dir hooks are private; if
+    # Textual stops calling them the tree falls back to Path.is_dir().
+    root = tmp_path.resolve()
+    _make_tree(root)
+    checked = []
+    is_dir = Path.is_dir
+
+    def recording_is_dir(path: Path) -> bool:
+        checked.append(path)
+        return is_dir(path)
+
+    monkeypatch.setattr(Path, "is_dir", recording_is_dir)
+
+    async def run() -> list[tuple[str, bool]]:
+        app = TreeApp(root)
+        async with app.run_test() as pilot:
+            tree = app.query_one(FilteredDirectoryTree)
+            await _wait_for(pilot, lambda: tree.root.children)
+            assert tree._entry_is_dir[root] == {
+                "sub": True,
+                "a.txt": False,
+                "b.bin": False,
+            }
+            return [
+                (str(node.label), node.allow_expand)
+                for node in tree.root.children
+            ]
+
+    assert asyncio.run(run()) == [("sub", True), ("a.txt", False)]
+    assert not [p for p in checked if p.parent == root]
+
+
+def test_reload_forgets_old_listings(tmp_path):
+    root = tmp_path.resolve()
+    _make_tree(root)
+
+    async def run() -> dict:
+        app = TreeApp(root)
+        async with app.run_test() as pilot:
+            tree = app.query_one(FilteredDirectoryTree)
+            await _wait_for(pilot, lambda: tree.root.children)
+            tree.root.children[0].expand()
+            await _wait_for(pilot, lambda: root / "sub" in tree._entry_is_dir)
+            shutil.rmtree(root / "sub")
+            await tree.reload()
+            await _wait_for(pilot, lambda: root in tree._entry_is_dir)
+            return dict(tree._entry_is_dir)
+
+    assert asyncio.run(run()) == {root: {"a.txt": False, "b.bin": False}}
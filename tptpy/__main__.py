@@ -8,19 +8,30 @@ Usage:
     tptpy [ROOT_PATH]
 """
 
+import copy
+import functools
+import hashlib
 import json
+import locale
+import mmap
+import operator
 import os
 import re
 import sys
 import io
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional, Union
 
-from textual import on, work
+from textual import events, on, work
 from textual.app import App, ComposeResult
+from textual.await_complete import AwaitComplete
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.reactive import var
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     ContentSwitcher,
@@ -38,30 +49,64 @@ from textual.widgets import (
     TextArea,
 )
 from textual.widgets._directory_tree import DirEntry
+from textual.worker import Worker, get_current_worker
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Parser backends
 # ---------------------------------------------------------------------------
 
-def parse_textfsm(source: str, template: str) -> list[dict[str, Any]]:
-    """Parse source text with a TextFSM template, return list of dicts."""
-    import textfsm as tfsm
-
-    tpl_fh = io.StringIO(template)
-    parser = tfsm.TextFSM(tpl_fh)
+def _compile_textfsm(template: str) -> tuple[Any, tuple[str, ...]]:
+    """Build a TextFSM parser plus its header for a template."""
+    # Backends are imported on first use, in the parse worker, so startup
+    # does not pay for them.
+    try:
+        import textfsm
+    except ImportError:
+        raise ImportError(
+            "textfsm is not installed (pip install textfsm)"
+        ) from None
+    parser = textfsm.TextFSM(io.StringIO(template))
+    # Interned so every record, and every recompile of an edited template,
+    # keys its dicts with the same string objects.
+    return parser, tuple(sys.intern(h) for h in parser.header)
+
+
+def _run_textfsm(
+    compiled: tuple[Any, tuple[str, ...]], source: str
+) -> list[dict[str, Any]]:
+    """Run a compiled TextFSM parser over source text."""
+    parser, headers = compiled
+    # The cached FSM keeps state from the previous run; start fresh.
+    parser.Reset()
     raw = parser.ParseText(source)
-    headers = parser.header
     return [dict(zip(headers, row)) for row in raw]
 
 
-def parse_ttp(source: str, template: str) -> list[dict[str, Any]]:
-    """Parse source text with a TTP template, return list of dicts."""
-    from ttp import ttp as ttp_mod
+def _compile_ttp(template: str) -> Any:
+    """Build a template-only TTP parser object, kept pristine in the cache."""
+    try:
+        from ttp import ttp
+    except ImportError:
+        raise ImportError("ttp is not installed (pip install ttp)") from None
+    return ttp(template=template)
+
 
-    parser = ttp_mod(data=source, template=template)
+def _run_ttp(compiled: Any, source: str) -> list[dict[str, Any]]:
+    """Run a compiled TTP parser over source text."""
+    # TTP keeps per-run state beyond its inputs and results (variables set
+    # by record/count/lookup, group defaults updated from them), so each
+    # run gets its own copy of the cached parser; still several times
+    # cheaper than a rebuild.
+    parser = copy.deepcopy(compiled)
+    parser.add_input(source)
     parser.parse()
     results = parser.result(format="raw")
-    # TTP nests results: [[[records]]], flatten until we get list of dicts
+    # TTP nests results: [[[records]]], flatten to a list of dicts
     while results and isinstance(results, list) and len(results) > 0:
         if isinstance(results[0], dict):
             break
@@ -69,47 +114,224 @@ def parse_ttp(source: str, template: str) -> list[dict[str, Any]]:
     return results if isinstance(results, list) else []
 
 
+def _digest(text: str) -> bytes:
+    """Short, stable fingerprint of a (possibly multi-MB) string."""
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+class CachedParser:
+    """A parser backend that reuses compiled templates across runs.
+
+    Compiled parser objects may be stateful (TextFSM's are), so each cached
+    entry carries its own lock; runs against different templates can
+    proceed concurrently.
+    """
+
+    __slots__ = ("_compile", "_run", "_maxsize", "_cache", "_cache_lock")
+
+    def __init__(
+        self,
+        compile_fn: Callable[[str], Any],
+        run_fn: Callable[[Any, str], list[dict[str, Any]]],
+        maxsize: int = 16,
+    ):
+        self._compile = compile_fn
+        self._run = run_fn
+        self._maxsize = maxsize
+        self._cache: "OrderedDict[bytes, tuple[Any, threading.Lock]]" = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
+
+    def _compiled(
+        self, template: str, key: bytes
+    ) -> tuple[Any, threading.Lock]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                return entry
+        entry = (self._compile(template), threading.Lock())
+        with self._cache_lock:
+            entry = self._cache.setdefault(key, entry)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        return entry
+
+    def __call__(
+        self,
+        source: str,
+        template: str,
+        template_key: Optional[bytes] = None,
+    ) -> list[dict[str, Any]]:
+        """Parse source; template_key is _digest(template) if already known."""
+        if template_key is None:
+            template_key = _digest(template)
+        compiled, lock = self._compiled(template, template_key)
+        with lock:
+            return self._run(compiled, source)
+
+
 PARSERS = {
-    "textfsm": parse_textfsm,
-    "ttp": parse_ttp,
+    "textfsm": CachedParser(_compile_textfsm, _run_textfsm),
+    "ttp": CachedParser(_compile_ttp, _run_ttp),
 }
 
+# Display names for the parser Select and status messages.
+PARSER_LABELS = {name: name.upper() for name in PARSERS}
+
+
+def run_parser(
+    parser_name: str,
+    source: str,
+    template: str,
+    template_key: Optional[bytes] = None,
+) -> list[dict[str, Any]]:
+    """Parse source with the named parser, reusing its compiled template."""
+    return PARSERS[parser_name](source, template, template_key)
+
+
+def parse_textfsm(source: str, template: str) -> list[dict[str, Any]]:
+    """Parse source text with a TextFSM template, return list of dicts."""
+    return run_parser("textfsm", source, template)
+
+
+def parse_ttp(source: str, template: str) -> list[dict[str, Any]]:
+    """Parse source text with a TTP template, return list of dicts."""
+    return run_parser("ttp", source, template)
+
+# ---------------------------------------------------------------------------
+# Result serialization
+# ---------------------------------------------------------------------------
+
+# The JSON view shows at most this many records, and at most this many
+# characters of them; the table holds them all.
+JSON_PREVIEW_RECORDS = 1000
+JSON_PREVIEW_CHARS = 256 * 1024
+
+
+def dump_results(results: Any) -> str:
+    """Render parse results as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            ).decode()
+        except TypeError:
+            # e.g. ints beyond 64 bits, which the stdlib encoder accepts
+            pass
+    return json.dumps(results, indent=2, default=str)
+
+
+def preview_results(results: list[Any]) -> str:
+    """Render the JSON view text, truncated to the JSON_PREVIEW_* limits."""
+    extra = len(results) - JSON_PREVIEW_RECORDS
+    text = dump_results(results[:JSON_PREVIEW_RECORDS])
+    if len(text) > JSON_PREVIEW_CHARS:
+        # Wide or deeply nested records: cut at a line boundary, unless a
+        # single huge value would leave next to nothing.
+        cut = text.rfind("\n", 0, JSON_PREVIEW_CHARS)
+        if cut < JSON_PREVIEW_CHARS // 2:
+            cut = JSON_PREVIEW_CHARS
+        return (
+            text[:cut]
+            + f"\n… (preview truncated at {JSON_PREVIEW_CHARS // 1024} KiB;"
+            " see the Table view)\n"
+        )
+    if extra <= 0:
+        return text
+    return text + f"\n… ({extra} more records; see the Table view)\n"
+
 # ---------------------------------------------------------------------------
 # Friendly error formatting
 # ---------------------------------------------------------------------------
 
+_TEXTFSM_LINE_RE = re.compile(r"[Ll]ine:?\s*(\d+)")
+
+# One case-insensitive scan picks out every known issue keyword in a message.
+_TEXTFSM_ISSUE_RE = re.compile(
+    r"(?P<invalid_state>invalid state name)"
+    r"|(?P<no_start>missing state '?start'?|no '?start'? state)"
+    r"|(?P<duplicate>duplicate)"
+    r"|(?P<rule>rule)"
+    r"|(?P<syntax>syntax)",
+    re.IGNORECASE,
+)
+
+_TEXTFSM_ISSUE_HINTS = {
+    "invalid_state": (
+        "  Issue: Invalid state name in Value definition.",
+        "  Hint:  Blank lines are not allowed between Value",
+        "         declarations. Remove any empty lines before",
+        "         the 'Start' state.",
+    ),
+    "no_start": (
+        "  Issue: Missing 'Start' state.",
+        "  Hint:  Every TextFSM template needs a 'Start' state",
+        "         after the Value declarations.",
+    ),
+    "duplicate": (
+        "  Issue: Duplicate value or state name.",
+        "  Hint:  Each Value name must be unique.",
+    ),
+    "rule_syntax": (
+        "  Issue: Rule syntax error.",
+        "  Hint:  Check regex patterns and -> actions.",
+    ),
+}
+
+
+def _line_window(text: str, start: int, stop: int) -> list[str]:
+    """Return lines ``start``..``stop`` of text without splitting all of it."""
+    pos = 0
+    for _ in range(start):
+        pos = text.find("\n", pos) + 1
+        if not pos:
+            return []
+    lines: list[str] = []
+    while len(lines) < stop - start and pos < len(text):
+        end = text.find("\n", pos)
+        if end < 0:
+            end = len(text)
+        lines.append(text[pos:end].rstrip("\r"))
+        pos = end + 1
+    return lines
+
+
+def _line_count(text: str) -> int:
+    """Count lines the way str.splitlines() would for newline-split text."""
+    return text.count("\n") + (1 if text and text[-1] != "\n" else 0)
+
+
 def _format_textfsm_error(exc: Exception, template: str) -> str:
     """Extract actionable info from a TextFSM exception."""
     msg = str(exc)
-    lines = template.splitlines()
     parts = ["TextFSM Error", "=" * 50, ""]
 
-    line_match = re.search(r"[Ll]ine:?\s*(\d+)", msg)
+    line_match = _TEXTFSM_LINE_RE.search(msg)
     if line_match:
         line_no = int(line_match.group(1))
         parts.append(f"  Problem at line {line_no}:")
         start = max(0, line_no - 3)
-        end = min(len(lines), line_no + 2)
-        for i in range(start, end):
-            marker = " >>>" if i == line_no - 1 else "    "
-            parts.append(f"{marker} {i + 1:3d} | {lines[i]}")
+        lines = _line_window(template, start, line_no + 2)
+        parts.extend(
+            f"{' >>>' if i == line_no - 1 else '    '} {i + 1:3d} | {line}"
+            for i, line in enumerate(lines, start)
+        )
         parts.append("")
 
-    if "Invalid state name" in msg:
-        parts.append("  Issue: Invalid state name in Value definition.")
-        parts.append("  Hint:  Blank lines are not allowed between Value")
-        parts.append("         declarations. Remove any empty lines before")
-        parts.append("         the 'Start' state.")
-    elif "No 'Start' state" in msg or "no Start state" in msg.lower():
-        parts.append("  Issue: Missing 'Start' state.")
-        parts.append("  Hint:  Every TextFSM template needs a 'Start' state")
-        parts.append("         after the Value declarations.")
-    elif "duplicate" in msg.lower():
-        parts.append("  Issue: Duplicate value or state name.")
-        parts.append("  Hint:  Each Value name must be unique.")
-    elif "rule" in msg.lower() and "syntax" in msg.lower():
-        parts.append("  Issue: Rule syntax error.")
-        parts.append("  Hint:  Check regex patterns and -> actions.")
+    found = {m.lastgroup for m in _TEXTFSM_ISSUE_RE.finditer(msg)}
+    if {"rule", "syntax"} <= found:
+        found.add("rule_syntax")
+    # Dict order is the priority order when several issues match.
+    for issue, hint in _TEXTFSM_ISSUE_HINTS.items():
+        if issue in found:
+            parts.extend(hint)
+            break
     else:
         parts.append(f"  Detail: {msg}")
 
@@ -119,7 +341,6 @@ def _format_textfsm_error(exc: Exception, template: str) -> str:
 def _format_ttp_error(exc: Exception, template: str) -> str:
     """Extract actionable info from a TTP exception."""
     msg = str(exc)
-    lines = template.splitlines()
     parts = ["TTP Error", "=" * 50, ""]
 
     if "template" in msg.lower():
@@ -131,10 +352,13 @@ def _format_ttp_error(exc: Exception, template: str) -> str:
 
     parts.append("")
     parts.append("  Template preview:")
-    for i, line in enumerate(lines[:10], 1):
-        parts.append(f"    {i:3d} | {line}")
-    if len(lines) > 10:
-        parts.append(f"    ... ({len(lines) - 10} more lines)")
+    parts.extend(
+        f"    {i:3d} | {line}"
+        for i, line in enumerate(_line_window(template, 0, 10), 1)
+    )
+    line_count = _line_count(template)
+    if line_count > 10:
+        parts.append(f"    ... ({line_count - 10} more lines)")
 
     parts.append("")
     parts.append("  Tips:")
@@ -163,9 +387,9 @@ SNIPPET_TEXTFSM = '''\
 """Auto-generated TextFSM parse snippet."""
 import io, json, textfsm
 
-TEMPLATE = """{template}"""
+TEMPLATE = {template}
 
-SOURCE = """{source}"""
+SOURCE = {source}
 
 parser = textfsm.TextFSM(io.StringIO(TEMPLATE))
 raw = parser.ParseText(SOURCE)
@@ -180,9 +404,9 @@ SNIPPET_TTP = '''\
 import json
 from ttp import ttp
 
-TEMPLATE = """{template}"""
+TEMPLATE = {template}
 
-SOURCE = """{source}"""
+SOURCE = {source}
 
 parser = ttp(data=SOURCE, template=TEMPLATE)
 parser.parse()
@@ -193,41 +417,197 @@ print(json.dumps(results, indent=2))
 '''
 
 
+def _split_snippet(tpl: str) -> tuple[str, str, str]:
+    """Split a snippet template into the text around its two payloads."""
+    head, rest = tpl.split("{template}")
+    mid, tail = rest.split("{source}")
+    return head, mid, tail
+
+
+_SNIPPET_PARTS = {
+    "textfsm": _split_snippet(SNIPPET_TEXTFSM),
+    "ttp": _split_snippet(SNIPPET_TTP),
+}
+
+
+def _py_literal(text: str) -> str:
+    """Return a Python string literal that evaluates back to ``text``.
+
+    Prefers a readable raw triple-quoted block and falls back to repr()
+    when the payload contains something a raw literal cannot carry.
+    """
+    if (
+        '"""' in text
+        or text.endswith(('"', "\\"))
+        or "\r" in text
+        or "\0" in text
+    ):
+        return repr(text)
+    return f'r"""{text}"""'
+
+
+# Above this combined payload size the snippet is built only when the user
+# focuses the snippet pane, not on every parse.
+SNIPPET_EAGER_BYTES = 256 * 1024
+
+SNIPPET_DEFERRED = (
+    "# Parse succeeded — source + template are large, so the snippet\n"
+    "# is generated on demand. Focus this pane to build it."
+)
+
+
 def generate_snippet(parser_type: str, source: str, template: str) -> str:
     """Return a self-contained Python script embedding source + template."""
-    tpl = SNIPPET_TEXTFSM if parser_type == "textfsm" else SNIPPET_TTP
-    return tpl.format(
-        template=template.replace('"""', r'\"\"\"'),
-        source=source.replace('"""', r'\"\"\"'),
-    )
+    head, mid, tail = _SNIPPET_PARTS[
+        "textfsm" if parser_type == "textfsm" else "ttp"
+    ]
+    return "".join((
+        head, _py_literal(template), mid, _py_literal(source), tail,
+    ))
+
+
+_SNIPPET_CACHE: "OrderedDict[tuple[str, bytes, bytes], str]" = OrderedDict()
+_SNIPPET_CACHE_SIZE = 8
+_SNIPPET_LOCK = threading.Lock()
+
+
+def cached_snippet(
+    parser_type: str,
+    source: str,
+    template: str,
+    key: Optional[tuple[str, bytes, bytes]] = None,
+) -> str:
+    """generate_snippet(), memoized on digests of the inputs.
+
+    Pass key as ``(parser_type, _digest(source), _digest(template))`` when
+    the caller has already hashed the inputs. Only inputs up to
+    SNIPPET_EAGER_BYTES are memoized, so the cache stays small.
+    """
+    if len(source) + len(template) > SNIPPET_EAGER_BYTES:
+        return generate_snippet(parser_type, source, template)
+    if key is None:
+        key = (parser_type, _digest(source), _digest(template))
+    with _SNIPPET_LOCK:
+        snippet = _SNIPPET_CACHE.get(key)
+        if snippet is not None:
+            _SNIPPET_CACHE.move_to_end(key)
+            return snippet
+    snippet = generate_snippet(parser_type, source, template)
+    with _SNIPPET_LOCK:
+        _SNIPPET_CACHE[key] = snippet
+        if len(_SNIPPET_CACHE) > _SNIPPET_CACHE_SIZE:
+            _SNIPPET_CACHE.popitem(last=False)
+    return snippet
 
 
 # ---------------------------------------------------------------------------
 # Custom filtered directory tree (show common text/template extensions)
 # ---------------------------------------------------------------------------
 
-TEXT_EXTENSIONS = {
+TEXT_EXTENSIONS: frozenset[str] = frozenset({
     ".txt", ".log", ".cfg", ".conf", ".csv", ".json", ".yaml", ".yml",
     ".xml", ".textfsm", ".template", ".ttp", ".tpl", ".py", ".md",
-    ".ini", ".toml",".raw"
-}
-
+    ".ini", ".toml", ".raw",
+})
+
+# Files with these extensions load into the template pane, others into source.
+TEMPLATE_EXTENSIONS: frozenset[str] = frozenset({
+    ".textfsm", ".template", ".ttp", ".tpl",
+})
+
+# Files above this size are refused rather than loaded into an editor pane.
+MAX_FILE_BYTES = 64 * 1024 * 1024
+# Files above this size are decoded straight from a memory map.
+LARGE_FILE_BYTES = 4 * 1024 * 1024
+
+
+def read_text_file(path: Path, size: int) -> str:
+    """Read a text file, mapping large ones instead of buffering the bytes."""
+    if size <= LARGE_FILE_BYTES:
+        return path.read_text(errors="replace")
+    with open(path, "rb") as fh, mmap.mmap(
+        fh.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        # The encoding read_text() and write_text() use, so a file decodes
+        # the same whatever its size.
+        text = str(mm, locale.getpreferredencoding(False), "replace")
+    # Match the universal-newline translation read_text() performs. For
+    # CRLF captures this is one more full-size copy, so the saving over
+    # read_text() is only the bytes buffer; LF-only text is returned as is.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class ScandirDirectoryTree(DirectoryTree):
+    """DirectoryTree that lists with os.scandir and reuses each entry's type.
+
+    The stock tree lists with Path.iterdir() and then stat()s every path
+    again to filter, sort and decide which nodes can expand. scandir
+    already reports the type, so it is remembered per directory listing
+    and served from :meth:`is_dir`.
+    """
 
-class FilteredDirectoryTree(DirectoryTree):
+    def __init__(self, path: Union[str, Path], **kwargs: Any) -> None:
+        super().__init__(path, **kwargs)
+        # directory -> {entry name: is_dir} from its latest listing
+        self._entry_is_dir: dict[Path, dict[str, bool]] = {}
+
+    def is_dir(self, path: Path) -> bool:
+        """Return whether path is a directory, as of its last listing."""
+        is_dir = self._entry_is_dir.get(path.parent, {}).get(path.name)
+        if is_dir is None:
+            return super()._safe_is_dir(path)
+        return is_dir
+
+    def reload(self) -> AwaitComplete:
+        # Forget every listing, including those of since-deleted folders.
+        self._entry_is_dir.clear()
+        return super().reload()
+
+    # DirectoryTree hooks: feed listing and type checks from scandir.
+    # Both are private; tests/test_tree.py fails if they stop being used.
+
+    def _safe_is_dir(self, path: Path) -> bool:
+        return self.is_dir(path)
+
+    def _directory_content(
+        self, location: Path, worker: Worker
+    ) -> Iterator[Path]:
+        # A re-listing replaces what was known about this directory.
+        listing: dict[str, bool] = {}
+        self._entry_is_dir[location] = listing
+        try:
+            with os.scandir(location) as entries:
+                for entry in entries:
+                    if worker.is_cancelled:
+                        break
+                    try:
+                        listing[entry.name] = entry.is_dir()
+                    except OSError:
+                        listing[entry.name] = False
+                    yield location / entry.name
+        except OSError:
+            pass
+
+
+class FilteredDirectoryTree(ScandirDirectoryTree):
     """DirectoryTree that filters to text-ish files."""
 
     def filter_paths(self, paths: list[Path]) -> list[Path]:
+        # The suffix test is string-only; the type check only for the rest.
         return [
             p for p in paths
-            if p.is_dir() or p.suffix.lower() in TEXT_EXTENSIONS
+            if ((suffix := p.suffix) and suffix.lower() in TEXT_EXTENSIONS)
+            or self.is_dir(p)
         ]
 
 
-class FolderOnlyTree(DirectoryTree):
+class FolderOnlyTree(ScandirDirectoryTree):
     """DirectoryTree that shows only directories (for save dialog)."""
 
     def filter_paths(self, paths: list[Path]) -> list[Path]:
-        return [p for p in paths if p.is_dir()]
+        return [p for p in paths if self.is_dir(p)]
 
 
 # ---------------------------------------------------------------------------
@@ -309,22 +689,24 @@ class SaveDialog(ModalScreen[Optional[Path]]):
                 yield Button("Save", id="save-ok-btn", variant="success")
 
     def on_mount(self) -> None:
-        self.query_one("#save-filename-input", Input).focus()
+        self._filename_input = self.query_one("#save-filename-input", Input)
+        self._path_display = self.query_one("#save-path-display", Static)
+        self._filename_input.focus()
 
     @on(DirectoryTree.DirectorySelected, "#save-dir-tree")
     def handle_dir_selected(
         self, event: DirectoryTree.DirectorySelected
     ) -> None:
         self._selected_dir = event.path
-        self.query_one("#save-path-display", Static).update(
+        self._path_display.update(
             f"  Directory: {event.path}"
         )
 
     @on(Button.Pressed, "#save-ok-btn")
     def handle_save(self) -> None:
-        filename = self.query_one("#save-filename-input", Input).value.strip()
+        filename = self._filename_input.value.strip()
         if not filename:
-            self.query_one("#save-path-display", Static).update(
+            self._path_display.update(
                 "  ⚠ Enter a filename"
             )
             return
@@ -469,11 +851,12 @@ class InputDialog(ModalScreen[Optional[str]]):
                 )
 
     def on_mount(self) -> None:
-        self.query_one("#input-dialog-field", Input).focus()
+        self._field = self.query_one("#input-dialog-field", Input)
+        self._field.focus()
 
     @on(Button.Pressed, "#input-ok-btn")
     def handle_ok(self) -> None:
-        value = self.query_one("#input-dialog-field", Input).value.strip()
+        value = self._field.value.strip()
         if value:
             self.dismiss(value)
 
@@ -493,6 +876,28 @@ class InputDialog(ModalScreen[Optional[str]]):
 # Main application
 # ---------------------------------------------------------------------------
 
+# Result rows are added to the table a page at a time as the user scrolls.
+TABLE_PAGE_ROWS = 500
+
+# Parse requests arriving within this many seconds collapse into one run.
+PARSE_DEBOUNCE = 0.15
+
+
+def _table_rows(
+    results: list[dict[str, Any]], cols: list[str]
+) -> list[list[str]]:
+    """Stringify result records into table rows, in column order."""
+    if len(cols) > 1:
+        # Uniform records (always the case for TextFSM) take the C-level
+        # itemgetter path; ragged ones fall through to .get() below.
+        getter = operator.itemgetter(*cols)
+        try:
+            return [[str(v) for v in getter(row)] for row in results]
+        except KeyError:
+            pass
+    return [[str(row.get(c, "")) for c in cols] for row in results]
+
+
 class ParseTesterApp(App):
     """Textual app for interactively testing TextFSM / TTP templates."""
 
@@ -636,9 +1041,28 @@ class ParseTesterApp(App):
         Binding("ctrl+q", "quit", "Quit", show=True),
     ]
 
+    # Mirrors #parser-select (which has no blank option); see
+    # handle_parser_changed.
+    parser_name: var[str] = var("textfsm")
+
     def __init__(self, root_path: str = "."):
         super().__init__()
         self.root_path = str(Path(root_path).resolve())
+        # Records behind #result-table; rows from _table_next on are not yet
+        # stringified or added (see _fill_table_page).
+        self._table_records: list[dict[str, Any]] = []
+        self._table_cols: list[str] = []
+        self._table_next = 0
+        # Latest status message waiting for the next refresh (see _set_status).
+        self._pending_status: Optional[str] = None
+        # (parser_name, source, template) for a snippet not yet generated.
+        self._deferred_snippet: Optional[tuple[str, str, str]] = None
+        # (parser_name, source digest, template digest) of the results shown.
+        self._last_run_key: Optional[tuple[str, bytes, bytes]] = None
+        # Bumped for every parse request; only the latest may paint results.
+        self._parse_seq = 0
+        # Pending debounced parse (see _request_parse).
+        self._parse_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -675,8 +1099,11 @@ class ParseTesterApp(App):
                 # Controls bar
                 with Horizontal(id="controls-bar"):
                     yield Select(
-                        [(name.upper(), name) for name in PARSERS],
-                        value="textfsm",
+                        [
+                            (label, name)
+                            for name, label in PARSER_LABELS.items()
+                        ],
+                        value=self.parser_name,
                         prompt="Parser",
                         id="parser-select",
                         allow_blank=False,
@@ -736,58 +1163,107 @@ class ParseTesterApp(App):
         yield Static("Ready", id="status-bar")
         yield Footer()
 
+    def on_mount(self) -> None:
+        # The layout is static, so resolve the widgets handlers touch once.
+        self._source_ta = self.query_one("#source-text", TextArea)
+        self._template_ta = self.query_one("#template-text", TextArea)
+        self._result_json = self.query_one("#result-json", TextArea)
+        self._result_table = self.query_one("#result-table", DataTable)
+        self._snippet_ta = self.query_one("#snippet-text", TextArea)
+        self._status = self.query_one("#status-bar", Static)
+        self._dir_tree = self.query_one("#dir-tree", FilteredDirectoryTree)
+        self._root_input = self.query_one("#root-input", Input)
+        self._result_switcher = self.query_one(
+            "#result-switcher", ContentSwitcher
+        )
+        self.watch(
+            self._result_table, "scroll_y", self._on_table_scroll, init=False
+        )
+
     # ----- helpers -----
 
     def _get_selected_tree_path(self) -> Optional[Path]:
         """Return the path of the currently highlighted node in the tree."""
-        tree = self.query_one("#dir-tree", FilteredDirectoryTree)
-        node = tree.cursor_node
+        node = self._dir_tree.cursor_node
         if node is None:
             return None
         return node.data.path if node.data else None
 
     def _refresh_tree(self) -> None:
         """Reload the directory tree to reflect filesystem changes."""
-        tree = self.query_one("#dir-tree", FilteredDirectoryTree)
-        tree.reload()
+        self._dir_tree.reload()
 
     def _set_status(self, msg: str) -> None:
-        self.query_one("#status-bar", Static).update(msg)
+        """Show msg in the status bar; only the last one per frame is drawn."""
+        if self._pending_status is None:
+            self.call_after_refresh(self._flush_status)
+        self._pending_status = msg
+
+    def _flush_status(self) -> None:
+        msg, self._pending_status = self._pending_status, None
+        if msg is not None:
+            self._status.update(msg)
+
+    def _clear_table(self) -> None:
+        """Empty the result table and drop any rows still waiting to load."""
+        self._table_records = []
+        self._table_cols = []
+        self._table_next = 0
+        self._result_table.clear(columns=True)
+
+    def _fill_table_page(self) -> None:
+        """Stringify the next page of records and add it to the table."""
+        start = self._table_next
+        if start >= len(self._table_records):
+            return
+        self._table_next = start + TABLE_PAGE_ROWS
+        self._result_table.add_rows(
+            _table_rows(
+                self._table_records[start:self._table_next], self._table_cols
+            )
+        )
+
+    def _on_table_scroll(self, scroll_y: float) -> None:
+        """Top up the result table when the view nears its last rows."""
+        if self._table_next >= len(self._table_records):
+            return
+        table = self._result_table
+        if scroll_y >= table.max_scroll_y - table.size.height:
+            self._fill_table_page()
 
     # ----- parse actions / event handlers -----
 
     def action_parse(self) -> None:
         """Trigger a parse run."""
-        self._run_parse()
+        self._request_parse()
 
     def action_set_root(self) -> None:
         """Focus the root input."""
-        self.query_one("#root-input", Input).focus()
+        self._root_input.focus()
 
     @on(Button.Pressed, "#parse-btn")
     def handle_parse_btn(self) -> None:
-        self._run_parse()
+        self._request_parse()
 
     @on(Button.Pressed, "#clear-btn")
     def handle_clear_btn(self) -> None:
-        self.query_one("#source-text", TextArea).text = ""
-        self.query_one("#template-text", TextArea).text = ""
-        self.query_one("#result-json", TextArea).text = ""
-        self.query_one("#snippet-text", TextArea).text = (
-            "# Parse to generate a snippet..."
-        )
-        table = self.query_one("#result-table", DataTable)
-        table.clear(columns=True)
-        self._set_status("Cleared.")
+        with self.batch_update():
+            self._source_ta.load_text("")
+            self._template_ta.load_text("")
+            self._result_json.load_text("")
+            self._snippet_ta.load_text("# Parse to generate a snippet...")
+            self._deferred_snippet = None
+            self._last_run_key = None
+            self._parse_seq += 1
+            self._clear_table()
+            self._set_status("Cleared.")
 
     @on(Button.Pressed, "#set-root-btn")
     def handle_set_root(self) -> None:
-        path_input = self.query_one("#root-input", Input)
-        new_root = Path(path_input.value).expanduser().resolve()
+        new_root = Path(self._root_input.value).expanduser().resolve()
         if new_root.is_dir():
-            tree = self.query_one("#dir-tree", FilteredDirectoryTree)
-            tree.path = new_root
-            tree.reload()
+            self._dir_tree.path = new_root
+            self._dir_tree.reload()
             self.root_path = str(new_root)
             self._set_status(f"Root set: {new_root}")
         else:
@@ -797,23 +1273,68 @@ class ParseTesterApp(App):
     def handle_file_selected(self, event: DirectoryTree.FileSelected) -> None:
         """Load selected file into the appropriate text area."""
         path = event.path
+        # Decide where to load: templates go to template pane, else source
+        is_template = path.suffix.lower() in TEMPLATE_EXTENSIONS
+        self._set_status(f"Loading {path.name}…")
+        # One in-flight read per pane; a newer click replaces an older one.
+        self.run_worker(
+            functools.partial(self._load_file_worker, path, is_template),
+            thread=True,
+            exclusive=True,
+            group="load-template" if is_template else "load-source",
+        )
+
+    def _load_file_worker(self, path: Path, is_template: bool) -> None:
+        """Read a file off the event loop and hand it to an editor pane."""
+        worker = get_current_worker()
         try:
-            content = path.read_text(errors="replace")
+            size = path.stat().st_size
+            if size > MAX_FILE_BYTES:
+                self.call_from_thread(
+                    self._set_status,
+                    f"⚠ {path.name} is too large to load "
+                    f"({size // (1024 * 1024)} MiB)",
+                )
+                return
+            content = read_text_file(path, size)
         except Exception as exc:
-            self._set_status(f"⚠ Could not read {path.name}: {exc}")
+            self.call_from_thread(
+                self._set_status, f"⚠ Could not read {path.name}: {exc}"
+            )
             return
+        if not worker.is_cancelled:
+            self.call_from_thread(
+                self._apply_loaded_file, path, content, is_template
+            )
 
-        # Decide where to load: templates go to template pane, else source
-        if path.suffix.lower() in {".textfsm", ".template", ".ttp", ".tpl"}:
-            self.query_one("#template-text", TextArea).text = content
+    def _apply_loaded_file(
+        self, path: Path, content: str, is_template: bool
+    ) -> None:
+        """Put freshly read file content into the source or template pane."""
+        if is_template:
+            self._template_ta.load_text(content)
             self._set_status(f"Template loaded: {path.name}")
         else:
-            self.query_one("#source-text", TextArea).text = content
+            self._source_ta.load_text(content)
             self._set_status(f"Source loaded: {path.name}")
 
+    @on(events.DescendantFocus, "#snippet-text")
+    def handle_snippet_focus(self) -> None:
+        """Build a deferred snippet once the user looks at the pane."""
+        if self._deferred_snippet is not None:
+            # Large inputs: build it fresh rather than pin it in the cache.
+            self._snippet_ta.load_text(
+                generate_snippet(*self._deferred_snippet)
+            )
+            self._deferred_snippet = None
+
+    @on(Select.Changed, "#parser-select")
+    def handle_parser_changed(self, event: Select.Changed) -> None:
+        self.parser_name = event.value
+
     @on(RadioSet.Changed, "#view-radio")
     def handle_view_toggle(self, event: RadioSet.Changed) -> None:
-        switcher = self.query_one("#result-switcher", ContentSwitcher)
+        switcher = self._result_switcher
         if event.index == 0:
             switcher.current = "result-json"
         else:
@@ -823,7 +1344,7 @@ class ParseTesterApp(App):
 
     def action_save_source(self) -> None:
         """Save source pane content via save dialog."""
-        content = self.query_one("#source-text", TextArea).text
+        content = self._source_ta.text
         if not content.strip():
             self._set_status("⚠ Source pane is empty — nothing to save.")
             return
@@ -831,14 +1352,13 @@ class ParseTesterApp(App):
 
     def action_save_template(self) -> None:
         """Save template pane content via save dialog."""
-        content = self.query_one("#template-text", TextArea).text
+        content = self._template_ta.text
         if not content.strip():
             self._set_status("⚠ Template pane is empty — nothing to save.")
             return
 
         # Suggest an extension based on parser type
-        parser_name = self.query_one("#parser-select", Select).value
-        if parser_name == "ttp":
+        if self.parser_name == "ttp":
             suggested = "template.ttp"
         else:
             suggested = "template.textfsm"
@@ -889,12 +1409,12 @@ class ParseTesterApp(App):
     def _create_new(self, kind: str) -> None:
         """Prompt for a name and create a new file or directory."""
         selected = self._get_selected_tree_path()
-        if selected and selected.is_dir():
+        if selected is None:
+            parent = Path(self.root_path)
+        elif self._dir_tree.is_dir(selected):
             parent = selected
-        elif selected and selected.is_file():
-            parent = selected.parent
         else:
-            parent = Path(self.root_path)
+            parent = selected.parent
 
         def on_name(name: Optional[str]) -> None:
             if name is None:
@@ -980,15 +1500,21 @@ class ParseTesterApp(App):
             self._set_status("⚠ Select a file or folder to delete.")
             return
 
-        kind = "directory" if selected.is_dir() else "file"
+        # The tree recorded the type when it listed the entry; a stale value
+        # only means rmdir()/unlink() fails and is reported below.
+        is_dir = self._dir_tree.is_dir(selected)
+        kind = "directory" if is_dir else "file"
 
         def on_confirm(confirmed: bool) -> None:
             if not confirmed:
                 self._set_status("Delete cancelled.")
                 return
             try:
-                if selected.is_dir():
-                    if any(selected.iterdir()):
+                if is_dir:
+                    # One readdir entry is enough to know it is not empty.
+                    with os.scandir(selected) as entries:
+                        not_empty = next(entries, None) is not None
+                    if not_empty:
                         self._set_status(
                             "⚠ Directory not empty. Remove contents first."
                         )
@@ -1011,10 +1537,17 @@ class ParseTesterApp(App):
 
     # ----- core parse logic -----
 
+    def _request_parse(self) -> None:
+        """Schedule a parse, restarting the wait if one is already pending."""
+        if self._parse_timer is not None:
+            self._parse_timer.stop()
+        self._parse_timer = self.set_timer(PARSE_DEBOUNCE, self._run_parse)
+
     def _run_parse(self) -> None:
-        source = self.query_one("#source-text", TextArea).text
-        template = self.query_one("#template-text", TextArea).text
-        parser_name = self.query_one("#parser-select", Select).value
+        self._parse_timer = None
+        source = self._source_ta.text
+        template = self._template_ta.text
+        parser_name = self.parser_name
 
         if not source.strip():
             self._set_status("⚠ Source text is empty.")
@@ -1022,48 +1555,138 @@ class ParseTesterApp(App):
         if not template.strip():
             self._set_status("⚠ Template is empty.")
             return
-        if parser_name is Select.BLANK:
-            self._set_status("⚠ Select a parser type.")
-            return
 
-        parse_fn = PARSERS[parser_name]
+        # Any run still in flight is now stale, even if it gets past its
+        # cancellation checks; _apply_* drop results from older requests.
+        self._parse_seq += 1
+        self._set_status(f"Parsing with {PARSER_LABELS[parser_name]}…")
+        self._parse_worker(self._parse_seq, source, template, parser_name)
+
+    def _skip_unchanged_run(
+        self, seq: int, run_key: tuple[str, bytes, bytes]
+    ) -> bool:
+        """Whether a run need not go on: superseded, or results on screen."""
+        if seq != self._parse_seq:
+            return True
+        if run_key == self._last_run_key:
+            # Same inputs as the results on screen; nothing to re-render.
+            self._set_status(
+                f"✓ Unchanged since last {PARSER_LABELS[run_key[0]]} parse"
+            )
+            return True
+        return False
+
+    @work(thread=True, exclusive=True, group="parse")
+    def _parse_worker(
+        self, seq: int, source: str, template: str, parser_name: str
+    ) -> None:
+        """Run the parser off the event loop and post results back."""
+        worker = get_current_worker()
+
+        # Hashed here, not in _run_parse: a multi-MB source takes long
+        # enough to stall the UI. The comparison with the results on
+        # screen still happens on the event loop, against the latest
+        # request.
+        run_key = (parser_name, _digest(source), _digest(template))
+        if worker.is_cancelled or self.call_from_thread(
+            self._skip_unchanged_run, seq, run_key
+        ):
+            return
 
         try:
-            results = parse_fn(source, template)
+            results = run_parser(parser_name, source, template, run_key[2])
         except Exception as exc:
+            if worker.is_cancelled:
+                return
             error_msg = format_parse_error(parser_name, exc, template)
-            self.query_one("#result-json", TextArea).text = error_msg
-            table = self.query_one("#result-table", DataTable)
-            table.clear(columns=True)
-            self.query_one("#snippet-text", TextArea).text = (
-                f"# Parse failed — fix template first\n# {exc}"
+            self.call_from_thread(
+                self._apply_parse_error, seq, parser_name, exc, error_msg
             )
-            self._set_status(f"✗ {parser_name.upper()}: {exc}")
             return
 
-        # ── populate JSON view ──
-        json_str = json.dumps(results, indent=2, default=str)
-        self.query_one("#result-json", TextArea).text = json_str
-
-        # ── populate table view ──
-        table = self.query_one("#result-table", DataTable)
-        table.clear(columns=True)
-        if results and isinstance(results[0], dict):
-            cols = list(results[0].keys())
-            for col in cols:
-                table.add_column(col, key=col)
-            for row in results:
-                table.add_row(*[str(row.get(c, "")) for c in cols])
-
-        # ── generate Python snippet ──
-        snippet = generate_snippet(parser_name, source, template)
-        self.query_one("#snippet-text", TextArea).text = snippet
-
-        count = len(results)
-        self._set_status(
-            f"✓ Parsed {count} record{'s' if count != 1 else ''} "
-            f"with {parser_name.upper()}"
-        )
+        # A newer Parse press superseded this run; skip rendering its output.
+        if worker.is_cancelled:
+            return
+
+        json_str = preview_results(results)
+        if len(source) + len(template) <= SNIPPET_EAGER_BYTES:
+            snippet = cached_snippet(parser_name, source, template, run_key)
+        else:
+            snippet = None
+        if not worker.is_cancelled:
+            self.call_from_thread(
+                self._apply_results,
+                seq,
+                parser_name,
+                source,
+                template,
+                results,
+                json_str,
+                snippet,
+                run_key,
+            )
+
+    def _apply_parse_error(
+        self, seq: int, parser_name: str, exc: Exception, error_msg: str
+    ) -> None:
+        """Show a failed parse in the result panes."""
+        if seq != self._parse_seq:
+            return
+        self._last_run_key = None
+        self._deferred_snippet = None
+        with self.batch_update():
+            self._result_json.load_text(error_msg)
+            self._clear_table()
+            self._snippet_ta.load_text(
+                f"# Parse failed — fix template first\n# {exc}"
+            )
+            self._set_status(f"✗ {PARSER_LABELS[parser_name]}: {exc}")
+
+    def _apply_results(
+        self,
+        seq: int,
+        parser_name: str,
+        source: str,
+        template: str,
+        results: list[dict[str, Any]],
+        json_str: str,
+        snippet: Optional[str],
+        run_key: tuple[str, bytes, bytes],
+    ) -> None:
+        """Populate the JSON, table and snippet panes from a parse run."""
+        if seq != self._parse_seq:
+            return
+        self._last_run_key = run_key
+        # One repaint for all three panes instead of one per update.
+        with self.batch_update():
+            # ── populate JSON view ──
+            self._result_json.load_text(json_str)
+
+            # ── populate table view ──
+            self._clear_table()
+            if results and isinstance(results[0], dict):
+                cols = list(results[0].keys())
+                for col in cols:
+                    self._result_table.add_column(col, key=col)
+                self._table_records = results
+                self._table_cols = cols
+                self._fill_table_page()
+
+            # ── show Python snippet (or defer it for large inputs) ──
+            if snippet is None:
+                self._deferred_snippet = (parser_name, source, template)
+                self._snippet_ta.load_text(SNIPPET_DEFERRED)
+            else:
+                self._deferred_snippet = None
+                # Unchanged on a repeat run; skip the reload and re-highlight.
+                if self._snippet_ta.text != snippet:
+                    self._snippet_ta.load_text(snippet)
+
+            count = len(results)
+            self._set_status(
+                f"✓ Parsed {count} {'record' if count == 1 else 'records'} "
+                f"with {PARSER_LABELS[parser_name]}"
+            )
 
 
 # ---------------------------------------------------------------------------